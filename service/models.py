@@ -33,6 +33,8 @@ from enum import Enum
 from decimal import Decimal
 from flask import Flask
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy.orm import make_transient_to_detached
+from psycopg2.extras import execute_values
 
 logger = logging.getLogger("flask.app")
 
@@ -175,6 +177,52 @@ class Product(db.Model):
         logger.info("Processing all Products")
         return cls.query.all()
 
+    @classmethod
+    def count(cls) -> int:
+        """Returns the number of Products in the database"""
+        logger.info("Processing count of all Products")
+        return db.session.scalar(db.select(db.func.count(cls.id)))
+
+    @classmethod
+    def bulk_create(cls, products: list) -> list:
+        """Creates many Products in the database with a single INSERT
+
+        Like create(), a missing available defaults to True and a missing
+        category defaults to Category.UNKNOWN.
+
+        :param products: the Products to add to the database
+        :type products: list
+
+        :return: the same Products with their new ids assigned, attached to the session
+        :rtype: list
+
+        """
+        logger.info("Bulk creating %d Products", len(products))
+        # Take the columns from the mapping so the SQL follows the schema
+        columns = [column for column in cls.__table__.columns if not column.primary_key]
+        rows = []
+        for product in products:
+            # the column defaults are skipped when bypassing the ORM
+            if product.available is None:
+                product.available = True
+            if product.category is None:
+                product.category = Category.UNKNOWN
+            values = [getattr(product, column.key) for column in columns]
+            # enums are stored by name
+            rows.append(tuple(value.name if isinstance(value, Enum) else value for value in values))
+        column_names = ", ".join(column.name for column in columns)
+        statement = f"INSERT INTO {cls.__tablename__} ({column_names}) VALUES %s RETURNING {cls.__table__.c.id.name}"
+        # Bypass the ORM unit of work and send every row in one statement
+        with db.session.connection().connection.cursor() as cursor:
+            ids = execute_values(cursor, statement, rows, fetch=True)
+        for product, (product_id,) in zip(products, ids):
+            product.id = product_id
+            # attach the already-inserted row so later update()/delete() calls work
+            make_transient_to_detached(product)
+            db.session.add(product)
+        db.session.commit()
+        return products
+
     @classmethod
     def find(cls, product_id: int):
         """Finds a Product by it's ID
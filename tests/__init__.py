@@ -0,0 +1,38 @@
+"""
+Test package for the Product service
+"""
+import functools
+
+# Engine settings used by every test module, whichever one runs first.
+# A single-threaded test runner never needs more than a few connections.
+ENGINE_OPTIONS = {
+    "pool_size": 5,
+    "max_overflow": 0,
+    "pool_pre_ping": True,
+    "pool_recycle": 3600,
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _init_db(app, database_uri):
+    """Rebuilds the engine with the test settings, cached on the database URI"""
+    # pylint: disable=import-outside-toplevel
+    from service.models import db, init_db
+
+    # Close the connections of the engine built when the service was imported
+    db.engine.dispose()
+    app.config["SQLALCHEMY_DATABASE_URI"] = database_uri
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"] = dict(ENGINE_OPTIONS)
+    init_db(app)
+
+
+def init_db_once(app):
+    """Initializes the database only once per URI for the whole test run
+
+    The engine is always built from ENGINE_OPTIONS, so its configuration does
+    not depend on which test class calls this first. Flask also refuses to
+    re-register the extension once the app has handled a request, which the
+    route tests do.
+    """
+    _init_db(app, app.config["SQLALCHEMY_DATABASE_URI"])
+    assert app.config["SQLALCHEMY_ENGINE_OPTIONS"] == ENGINE_OPTIONS, "test engine options were overridden"
@@ -17,12 +17,11 @@
 Product API Service Test Suite
 
 Test cases can be run with the following:
-  nosetests -v --with-spec --spec-color
-  coverage report -m
+  pytest -n auto --cov=service
   codecov --token=$CODECOV_TOKEN
 
   While debugging just these tests it's convenient to use this:
-    nosetests --stop tests/test_service.py:TestProductService
+    pytest -x tests/test_routes.py::TestProductRoutes
 """
 import os
 import logging
@@ -31,7 +30,8 @@ from unittest import TestCase
 from urllib.parse import quote_plus
 from service import app
 from service.common import status
-from service.models import db, init_db, Product
+from service.models import db, Product
+from tests import init_db_once
 from tests.factories import ProductFactory
 
 # Disable all but critical errors during normal test run
@@ -60,7 +60,7 @@ class TestProductRoutes(TestCase):
         # Set up the test database
         app.config["SQLALCHEMY_DATABASE_URI"] = DATABASE_URI
         app.logger.setLevel(logging.CRITICAL)
-        init_db(app)
+        init_db_once(app)
 
     @classmethod
     def tearDownClass(cls):
@@ -215,7 +215,7 @@ class TestProductRoutes(TestCase):
         response = self.client.get(f"{BASE_URL}/{test_product.id}")
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
         # Get new count of products
-        new_count = len(Product.all())
+        new_count = Product.count()
         self.assertEqual(new_count, expected - 1)
 
     def test_get_product_list(self):